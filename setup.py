@@ -55,6 +55,10 @@ setup(name='py-opensonic',
     packages=find_packages('src'),
     py_modules=['libopensonic'],
     install_requires=requirements,
+    extras_require={
+        'speedups': ['orjson', 'brotli'],
+        'streaming': ['ijson>=3.1'],
+    },
     python_requires='>=3',
     classifiers=[
         'Development Status :: 5 - Production/Stable',
@@ -0,0 +1,134 @@
+"""
+This file is part of py-opensonic.
+
+py-opensonic is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+py-opensonic is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .connection import Connection
+
+
+class AsyncConnection:
+    """
+    An asyncio front end to Connection.
+
+    Every public API method of Connection is available here as a coroutine
+    taking the same arguments and returning the same objects.  Calls are run
+    on a pool of worker threads so independent requests can be in flight at
+    the same time:
+
+        conn = AsyncConnection('https://music.example.com', 'user', 'pass')
+        album, artist = await asyncio.gather(conn.getAlbum(album_id),
+            conn.getArtist(artist_id))
+    """
+    def __init__(self, *args, maxWorkers=16, **kwargs):
+        """
+        Takes the same arguments as Connection plus:
+
+        maxWorkers:int      The maximum number of requests that will be in
+                            flight at once.  The connection pool is sized to
+                            match unless poolSize is given
+        """
+        kwargs.setdefault('poolSize', maxWorkers)
+        self._conn = Connection(*args, **kwargs)
+        self._executor = ThreadPoolExecutor(max_workers=maxWorkers)
+
+
+    connection = property(lambda s: s._conn)
+
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attr = getattr(self._conn, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor,
+                functools.partial(attr, *args, **kwargs))
+        return call
+
+
+    async def getAlbumsBulk(self, album_ids):
+        """
+        Fetches several albums concurrently, see Connection.getAlbumsBulk
+        """
+        return await self._gather(self.getAlbum, album_ids)
+
+
+    async def getSongsBulk(self, song_ids):
+        """
+        Fetches several songs concurrently, see Connection.getSongsBulk
+        """
+        return await self._gather(self.getSong, song_ids)
+
+
+    async def getArtistsBulk(self, artist_ids):
+        """
+        Fetches several artists concurrently, see Connection.getArtistsBulk
+        """
+        return await self._gather(self.getArtist, artist_ids)
+
+
+    async def getLyricsBulk(self, song_ids):
+        """
+        Fetches lyrics for several songs concurrently, see
+        Connection.getLyricsBulk
+        """
+        return await self._gather(self.getLyricsBySongId, song_ids)
+
+
+    async def callBulk(self, methodName, ids, **kwargs):
+        """
+        Calls the named API method once per id, concurrently, and returns the
+        results in the same order as ids.  This covers any method that takes
+        a single id, e.g.:
+
+            infos = await conn.callBulk('getAlbumInfo2', album_ids)
+
+        methodName:str      The name of the Connection method to call
+        ids:list            The ids to pass as the first argument
+        kwargs              Any extra keyword arguments for every call
+        """
+        func = getattr(self, methodName)
+        return await self._gather(functools.partial(func, **kwargs), ids)
+
+
+    async def _gather(self, func, ids):
+        return list(await asyncio.gather(*(func(i) for i in ids)))
+
+
+    async def __aenter__(self):
+        return self
+
+
+    async def __aexit__(self, *exc):
+        # close() waits for the calls still running, so keep it off the
+        # event loop's thread
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+
+    def close(self):
+        """
+        Waits for any outstanding calls, then releases the worker threads and
+        any pooled connections to the server
+        """
+        self._executor.shutdown(wait=True)
+        self._conn.close()
@@ -0,0 +1,95 @@
+"""
+This file is part of py-opensonic.
+
+py-opensonic is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+py-opensonic is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
+"""
+
+from collections import OrderedDict
+import threading
+import time
+
+
+class TTLCache:
+    """
+    A small thread safe LRU cache whose entries expire a fixed number of
+    seconds after they are stored.
+
+    Keys are expected to be tuples whose first element is the API method
+    name so that every entry for a method can be dropped with evict().
+
+    A response fetched while an evict() or clear() ran may already be stale,
+    so callers read generation before fetching and pass it to set(), which
+    then drops the value if anything was evicted in between.
+    """
+    def __init__(self, maxsize=1024, ttl=30):
+        """
+        maxsize:int     The maximum number of entries held before the least
+                        recently used one is dropped
+        ttl:float       The number of seconds an entry stays valid
+        """
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+
+
+    # Bumped by every evict() and clear()
+    generation = property(lambda s: s._generation)
+
+
+    def get(self, key):
+        """
+        Returns the value stored for key or None if it is missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+
+    def set(self, key, value, generation=None):
+        """
+        Stores value for key, unless generation is given and entries were
+        evicted since it was read
+        """
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+
+    def evict(self, *methodNames):
+        """
+        Drops every entry stored for the given API method names
+        """
+        with self._lock:
+            self._generation += 1
+            for key in [k for k in self._data if k[0] in methodNames]:
+                del self._data[key]
+
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
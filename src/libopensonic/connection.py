@@ -17,12 +17,27 @@ along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 
 from netrc import netrc
 from hashlib import md5
-import urllib.request
-import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+import functools
 import os
+import secrets
+import time
+from urllib.parse import urlsplit
 import requests
+from urllib3.util import Retry
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from . import errors
+from .cache import TTLCache
 from .media.podcast_channel import PodcastChannel
 from .media.podcast_channel import PodcastEpisode
 from .media.artist import (Artist, ArtistInfo)
@@ -32,6 +47,140 @@ from .media.index import Index
 from .media.playlist import Playlist
 
 API_VERSION = '1.16.1'
+_STATUS_OK = 'ok'
+
+# The default size of the connection pool, which is also the most requests
+# the *Bulk helpers will have in flight at once
+_POOL_SIZE = 16
+
+# (connect, read) timeouts for normal calls and for calls that send the
+# server long id lists to act on
+_TIMEOUT = (30, 60)
+_LIST_TIMEOUT = (60, 300)
+
+# How many seconds a generated auth salt and token are reused for
+_SALT_LIFETIME = 60
+
+# Transparently retry connection failures.  Read timeouts are not retried;
+# the server may already have acted on the call and the caller has waited
+# long enough
+_RETRY = Retry(total=3, read=0, backoff_factor=0.2,
+    allowed_methods=frozenset(('GET', 'POST')), raise_on_status=False)
+
+# Calls that only read from the server are also retried on gateway errors
+# from a proxy in front of it.  Other calls are not, a 502 or 504 doesn't
+# mean the server didn't do the work.  Once retries run out the last
+# response is returned so the usual HTTPError is raised
+_READ_RETRY = _RETRY.new(status_forcelist=(502, 503, 504),
+    respect_retry_after_header=True)
+
+# The read only calls whose names don't start with "get"
+_READ_ONLY_METHODS = frozenset(('ping', 'search', 'search2', 'search3',
+    'stream', 'download', 'hls'))
+
+# Read only calls whose responses may be served from the response cache
+_CACHED_METHODS = frozenset((
+    'getUser', 'getUsers', 'getArtist', 'getAlbum', 'getSong',
+    'getAlbumList', 'getAlbumList2', 'getStarred', 'getStarred2',
+    'getPodcasts', 'getShares', 'getVideos', 'getLyrics',
+    'getLyricsBySongId', 'getGenres', 'getMusicFolders', 'getArtistInfo',
+    'getArtistInfo2', 'getAlbumInfo', 'getAlbumInfo2', 'getVideoInfo',
+    'getCaptions', 'getInternetRadioStations', 'getTopSongs',
+    'getSongsByGenre',
+))
+
+# Parameter names for the calls that take a long list of optional arguments,
+# in the order their values are passed to _zipQuery()
+_USER_PARAMS = ('username', 'password', 'email', 'ldapAuthenticated',
+    'adminRole', 'settingsRole', 'streamRole', 'jukeboxRole', 'downloadRole',
+    'uploadRole', 'playlistRole', 'coverArtRole', 'commentRole',
+    'podcastRole', 'shareRole', 'videoConversionRole', 'musicFolderId')
+_UPDATE_USER_PARAMS = _USER_PARAMS + ('maxBitRate',)
+_ALBUM_LIST_PARAMS = ('type', 'size', 'offset', 'fromYear', 'toYear',
+    'genre', 'musicFolderId')
+_ALBUM_LIST2_PARAMS = _ALBUM_LIST_PARAMS[:-1]
+_RANDOM_SONGS_PARAMS = ('size', 'genre', 'fromYear', 'toYear',
+    'musicFolderId')
+
+# Cached calls whose results carry star and rating information
+_RATED_METHODS = ('getArtist', 'getAlbum', 'getSong', 'getAlbumList',
+    'getAlbumList2', 'getStarred', 'getStarred2', 'getTopSongs',
+    'getSongsByGenre')
+
+
+def _zipQuery(names, values):
+    """
+    Builds a query dict from matching sequences of parameter names and
+    values, dropping None values
+    """
+    return {k: v for k, v in zip(names, values) if v is not None}
+
+
+def _asList(x):
+    """
+    Returns x as a list or tuple of ids, accepting None (no ids) or a
+    single id as well
+    """
+    if isinstance(x, (list, tuple)):
+        return x
+    return [] if x is None else [x]
+
+
+def _loadNetrc(path=None):
+    """
+    Returns the parsed netrc file at path, or the user's default netrc file
+    if path is None.  The parse is shared between Connection instances and
+    only redone when the file changes.
+    """
+    if path is None:
+        # Left to netrc() itself so it still checks the permissions of the
+        # default file, which holds passwords
+        fname = os.path.join(os.path.expanduser('~'), '.netrc')
+    else:
+        fname = path = os.path.expanduser(path)
+    return _parseNetrc(path, fname, os.stat(fname).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _parseNetrc(path, fname, mtime):
+    # fname and mtime only key the cache
+    return netrc(path)
+
+
+def _ts2milli(ts):
+    """
+    For whatever reason, Subsonic uses timestamps in milliseconds since
+    the unix epoch.  I have no idea what need there is of this precision,
+    but this will just multiply the timestamp times 1000 and return the int
+    """
+    return None if ts is None else int(ts * 1000)
+
+
+class _ApiAdapter(requests.adapters.BaseAdapter):
+    """
+    Sends each request through one of two pooled adapters, so that only read
+    only API calls get the gateway error retries of _READ_RETRY
+    """
+    def __init__(self, poolSize):
+        super().__init__()
+        self._read = requests.adapters.HTTPAdapter(pool_connections=4,
+            pool_maxsize=poolSize, max_retries=_READ_RETRY)
+        self._write = requests.adapters.HTTPAdapter(pool_connections=4,
+            pool_maxsize=poolSize, max_retries=_RETRY)
+
+
+    def send(self, request, **kwargs):
+        name = urlsplit(request.url).path.rsplit('/', 1)[-1]
+        if name.endswith('.view'):
+            name = name[:-5]
+        if name.startswith('get') or name in _READ_ONLY_METHODS:
+            return self._read.send(request, **kwargs)
+        return self._write.send(request, **kwargs)
+
+
+    def close(self):
+        self._read.close()
+        self._write.close()
 
 
 def pretty_print_post(req):
@@ -45,9 +194,19 @@ def pretty_print_post(req):
 
 
 class Connection:
+    # Every piece of per instance state, which keeps instances small and
+    # attribute lookups on the request path cheap
+    __slots__ = ('_apiVersion', '_appName', '_baseQdict', '_baseQdictExpiry',
+        '_baseUrl', '_cache', '_hostname', '_insecure', '_legacyAuth',
+        '_methodSuffix', '_netrc', '_ownSession', '_poolSize', '_port',
+        '_rawPass', '_salt', '_serverPath', '_session', '_token', '_urlPrefix',
+        '_useGET', '_username')
+
+
     def __init__(self, baseUrl, username=None, password=None, port=4040,
             serverPath='/rest', appName='py-opensonic', apiVersion=API_VERSION,
-            insecure=False, useNetrc=None, legacyAuth=False, useGET=False, useViews=True, salt=None, token=None):
+            insecure=False, useNetrc=None, legacyAuth=False, useGET=False, useViews=True, salt=None, token=None,
+            cacheTTL=0, cacheSize=1024, session=None, poolSize=_POOL_SIZE):
         """
         This will create a connection to your subsonic server
 
@@ -117,7 +276,27 @@ class Connection:
                             user the .view end points instead of just the method
                             name. Disable this to drop the .view extension to
                             method name, e.g. ping instead of ping.view
-        """
+        cacheTTL:float      If greater than zero, responses to read only calls
+                            (getAlbum, getArtist, getUser, ...) are cached
+                            for this many seconds.  Calls that modify the
+                            server drop the cached entries they affect and
+                            invalidateCache() drops everything, as does
+                            changing the server or the credentials.
+        cacheSize:int       The maximum number of cached responses
+        session:requests.Session    A preconfigured session to send
+                                    requests through, for instance one with
+                                    custom transport adapters mounted.  By
+                                    default a pooled keep-alive session is
+                                    created.  A session passed in here is
+                                    not closed by close().
+        poolSize:int        The number of keep-alive connections kept to
+                            the server, and the most requests the *Bulk
+                            methods run at once.  Raise this if you make
+                            more concurrent calls than that from several
+                            threads
+        """
+        self._baseQdict = None
+        self._cache = None
         self.setBaseUrl(baseUrl)
         self._username = username
         self._rawPass = password
@@ -125,7 +304,7 @@ class Connection:
         self._token = token
         self._legacyAuth = legacyAuth
         self._useGET = useGET
-        self._useViews = useViews
+        self._methodSuffix = '.view' if useViews else ''
         self._apiVersion = apiVersion
 
         self._netrc = None
@@ -141,32 +320,90 @@ class Connection:
         self._appName = appName
         self._serverPath = serverPath.strip('/')
         self._insecure = insecure
-        self._opener = self._getOpener(self._username, self._rawPass)
+
+        self._poolSize = poolSize
+        self._ownSession = session is None
+        if self._ownSession:
+            # Reuse connections (and their TLS sessions) across API calls.
+            # requests already asks for gzip compressed responses (and br or
+            # zstd when their decoders are installed) and transparently
+            # decodes them, which matters a lot for the big JSON lists
+            session = requests.Session()
+            adapter = _ApiAdapter(poolSize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self._session = session
+
+        self._cache = TTLCache(cacheSize, cacheTTL) if cacheTTL > 0 else None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+    def close(self):
+        """
+        Closes any pooled connections to the server
+        """
+        if self._ownSession:
+            self._session.close()
+
+
+    def invalidateCache(self):
+        """
+        Drops everything held in the response cache so the next calls go to
+        the server.  Useful after changes made outside of this connection,
+        like a library scan.  Does nothing if caching is disabled.
+        """
+        if self._cache is not None:
+            self._cache.clear()
 
 
     # Properties
     def setBaseUrl(self, url):
         self._baseUrl = url
+        self._urlPrefix = None
+        # The host name is what the netrc lookup is keyed on, so drop any
+        # credentials, port or path from the url but keep the case it was
+        # given in.  A url without a scheme is just host[:port][/path]
+        url = url.strip()
         if '://' in url:
-            self._hostname = url.split('://')[1].strip()
+            netloc = urlsplit(url).netloc
         else:
-            self._hostname = url
+            netloc = url.split('/', 1)[0]
+        host = netloc.rsplit('@', 1)[-1]
+        if host.startswith('['):
+            # IPv6 literal, the port follows the closing bracket
+            host = host[:host.find(']') + 1]
+        else:
+            host = host.split(':', 1)[0]
+        self._hostname = host
+        self.invalidateCache()
     baseUrl = property(lambda s: s._baseUrl, setBaseUrl)
 
 
     def setPort(self, port):
         self._port = int(port)
+        self._urlPrefix = None
+        self.invalidateCache()
     port = property(lambda s: s._port, setPort)
 
 
     def setUsername(self, username):
         self._username = username
+        self._baseQdict = None
+        self.invalidateCache()
     username = property(lambda s: s._username, setUsername)
 
 
     def setPassword(self, password):
         self._rawPass = password
-        # Redo the opener with the new creds
+        self._baseQdict = None
+        self.invalidateCache()
     password = property(lambda s: s._rawPass, setPassword)
 
 
@@ -175,6 +412,7 @@ class Connection:
 
     def setAppName(self, appName):
         self._appName = appName
+        self._baseQdict = None
     appName = property(lambda s: s._appName, setAppName)
 
 
@@ -183,6 +421,8 @@ class Connection:
         if path != '' and not path.endswith('/'):
             sep = '/'
         self._serverPath = f"{path}{sep}rest".strip('/')
+        self._urlPrefix = None
+        self.invalidateCache()
     serverPath = property(lambda s: s._serverPath, setServerPath)
 
 
@@ -193,6 +433,7 @@ class Connection:
 
     def setLegacyAuth(self, lauth):
         self._legacyAuth = lauth
+        self._baseQdict = None
     legacyAuth = property(lambda s: s._legacyAuth, setLegacyAuth)
 
 
@@ -209,19 +450,13 @@ class Connection:
         Returns a boolean True if the server is alive, False otherwise
         """
         methodName = 'ping'
-        viewName = '%s.view' % methodName
 
-        req = self._doRequest(viewName)
         try:
-            res = self._doInfoReq(req)
-        except:
+            self._handleInfoRes(self._doRequest(methodName))
+        except (requests.exceptions.RequestException, ValueError):
+            # ValueError covers a reply that is not JSON at all
             return False
-        if res['status'] == 'ok':
-            return True
-        elif res['status'] == 'failed':
-            exc = errors.getExcByCode(res['error']['code'])
-            raise exc(res['error']['message'])
-        return False
+        return True
 
 
     def getLicense(self):
@@ -242,10 +477,7 @@ class Connection:
         """
         methodName = 'getLicense'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
     
 
     def getOpenSubsonicExtensions(self):
@@ -264,10 +496,7 @@ class Connection:
         """
         methodName = 'getOpenSubsonicExtensions'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getScanStatus(self):
@@ -286,10 +515,7 @@ class Connection:
         """
         methodName = 'getScanStatus'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def startScan(self):
@@ -310,10 +536,7 @@ class Connection:
         """
         methodName = 'startScan'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getMusicFolders(self):
@@ -333,10 +556,7 @@ class Connection:
         """
         methodName = 'getMusicFolders'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getNowPlaying(self):
@@ -349,9 +569,7 @@ class Connection:
         """
         methodName = 'getNowPlaying'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName)
         playing = {}
         for entry in dres['nowPlaying']['entry']:
             playing[entry['username']] = Song(entry)
@@ -377,11 +595,9 @@ class Connection:
         methodName = 'getIndexes'
 
         q = self._getQueryDict({'musicFolderId': musicFolderId,
-            'ifModifiedSince': self._ts2milli(ifModifiedSince)})
+            'ifModifiedSince': _ts2milli(ifModifiedSince)})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         indices = [Index(entry) for entry in dres['indexes']['index']]
         return indices
 
@@ -443,10 +659,7 @@ class Connection:
         """
         methodName = 'getMusicDirectory'
 
-        res = self._doRequest(methodName, {'id': mid})
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, {'id': mid})
 
 
     def search(self, artist=None, album=None, title=None, any=None,
@@ -474,12 +687,9 @@ class Connection:
 
         q = self._getQueryDict({'artist': artist, 'album': album,
             'title': title, 'any': any, 'count': count, 'offset': offset,
-            'newerThan': self._ts2milli(newerThan)})
+            'newerThan': _ts2milli(newerThan)})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
 
 
     def search2(self, query, artistCount=20, artistOffset=0, albumCount=20,
@@ -510,9 +720,7 @@ class Connection:
             'albumOffset': albumOffset, 'songCount': songCount,
             'songOffset': songOffset, 'musicFolderId': musicFolderId})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         found = {}
         if 'artist' in dres['searchResult2']:
             found['artists'] = [Artist(entry) for entry in dres['searchResult2']['artist']]
@@ -557,9 +765,7 @@ class Connection:
             'albumOffset': albumOffset, 'songCount': songCount,
             'songOffset': songOffset, 'musicFolderId': musicFolderId})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         found = {}
         if 'artist' in dres['searchResult3']:
             found['artists'] = [Artist(entry) for entry in dres['searchResult3']['artist']]
@@ -598,10 +804,8 @@ class Connection:
 
         q = self._getQueryDict({'username': username})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return [Playlist(entry) for entry in dres['playlists']['playlist']]
+        return list(map(Playlist, self._call(methodName, q,
+            extract='playlists.playlist')))
 
 
     def getPlaylist(self, pid):
@@ -617,10 +821,7 @@ class Connection:
         """
         methodName = 'getPlaylist'
 
-        res = self._doRequest(methodName, {'id': pid})
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return Playlist(dres['playlist'])
+        return Playlist(self._call(methodName, {'id': pid}, extract='playlist'))
 
 
     def createPlaylist(self, playlistId=None, name=None, songIds=None):
@@ -641,9 +842,6 @@ class Connection:
         """
         methodName = 'createPlaylist'
 
-        if songIds is None:
-            songIds = []
-
         if playlistId == name == None:
             raise errors.ArgumentError('You must supply either a playlistId or a name')
         if playlistId is not None and name is not None:
@@ -652,10 +850,8 @@ class Connection:
 
         q = self._getQueryDict({'playlistId': playlistId, 'name': name})
 
-        res = self._doRequestWithList(methodName, 'songId', songIds, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        q['songId'] = _asList(songIds)
+        return self._simple(methodName, q)
 
 
     def deletePlaylist(self, pid):
@@ -671,10 +867,7 @@ class Connection:
         """
         methodName = 'deletePlaylist'
 
-        res = self._doRequest(methodName, {'id': pid})
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, {'id': pid})
 
 
     def download(self, sid):
@@ -690,7 +883,7 @@ class Connection:
         """
         methodName = 'download'
 
-        res = self._doRequest(methodName, {'id': sid})
+        res = self._doRequest(methodName, {'id': sid}, is_stream=True)
         dres = self._handleBinRes(res)
         if isinstance(dres, dict):
             self._checkStatus(dres)
@@ -797,12 +990,9 @@ class Connection:
         methodName = 'scrobble'
 
         q = self._getQueryDict({'id': sid, 'submission': submission,
-            'time': self._ts2milli(listenTime)})
+            'time': _ts2milli(listenTime)})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q)
 
 
     def changePassword(self, username, password):
@@ -826,10 +1016,7 @@ class Connection:
         #q = {'username': username, 'password': hexPass.lower()}
         q = {'username': username, 'password': password}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q)
 
 
     def getUser(self, username):
@@ -862,12 +1049,9 @@ class Connection:
         """
         methodName = 'getUser'
 
-        q = {'username': username}
+        q = (('username', username),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
 
 
     def getUsers(self):
@@ -900,10 +1084,7 @@ class Connection:
         """
         methodName = 'getUsers'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def createUser(self, username, password, email,
@@ -930,22 +1111,13 @@ class Connection:
         methodName = 'createUser'
         hexPass = 'enc:%s' % self._hexEnc(password)
 
-        q = self._getQueryDict({
-            'username': username, 'password': hexPass, 'email': email,
-            'ldapAuthenticated': ldapAuthenticated, 'adminRole': adminRole,
-            'settingsRole': settingsRole, 'streamRole': streamRole,
-            'jukeboxRole': jukeboxRole, 'downloadRole': downloadRole,
-            'uploadRole': uploadRole, 'playlistRole': playlistRole,
-            'coverArtRole': coverArtRole, 'commentRole': commentRole,
-            'podcastRole': podcastRole, 'shareRole': shareRole,
-            'videoConversionRole': videoConversionRole,
-            'musicFolderId': musicFolderId
-        })
+        q = _zipQuery(_USER_PARAMS, (username, hexPass, email,
+            ldapAuthenticated, adminRole, settingsRole, streamRole,
+            jukeboxRole, downloadRole, uploadRole, playlistRole,
+            coverArtRole, commentRole, podcastRole, shareRole,
+            videoConversionRole, musicFolderId))
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getUser', 'getUsers'))
 
 
     def updateUser(self, username,  password=None, email=None,
@@ -973,21 +1145,12 @@ class Connection:
         methodName = 'updateUser'
         if password is not None:
             password = 'enc:%s' % self._hexEnc(password)
-        q = self._getQueryDict({'username': username, 'password': password,
-            'email': email, 'ldapAuthenticated': ldapAuthenticated,
-            'adminRole': adminRole,
-            'settingsRole': settingsRole, 'streamRole': streamRole,
-            'jukeboxRole': jukeboxRole, 'downloadRole': downloadRole,
-            'uploadRole': uploadRole, 'playlistRole': playlistRole,
-            'coverArtRole': coverArtRole, 'commentRole': commentRole,
-            'podcastRole': podcastRole, 'shareRole': shareRole,
-            'videoConversionRole': videoConversionRole,
-            'musicFolderId': musicFolderId, 'maxBitRate': maxBitRate
-        })
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        q = _zipQuery(_UPDATE_USER_PARAMS, (username, password, email,
+            ldapAuthenticated, adminRole, settingsRole, streamRole,
+            jukeboxRole, downloadRole, uploadRole, playlistRole,
+            coverArtRole, commentRole, podcastRole, shareRole,
+            videoConversionRole, musicFolderId, maxBitRate))
+        return self._simple(methodName, q, evicts=('getUser', 'getUsers'))
 
 
     def deleteUser(self, username):
@@ -1004,12 +1167,9 @@ class Connection:
         """
         methodName = 'deleteUser'
 
-        q = {'username': username}
+        q = (('username', username),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getUser', 'getUsers'))
 
 
     def getChatMessages(self, since=1):
@@ -1033,12 +1193,9 @@ class Connection:
         """
         methodName = 'getChatMessages'
 
-        q = {'since': self._ts2milli(since)}
+        q = (('since', _ts2milli(since)),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
 
 
     def addChatMessage(self, message):
@@ -1054,12 +1211,9 @@ class Connection:
         """
         methodName = 'addChatMessage'
 
-        q = {'message': message}
+        q = (('message', message),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q)
 
 
     def getAlbumList(self, ltype, size=10, offset=0, fromYear=None,
@@ -1092,16 +1246,11 @@ class Connection:
         """
         methodName = 'getAlbumList'
 
-        q = self._getQueryDict({'type': ltype, 'size': size,
-            'offset': offset, 'fromYear': fromYear, 'toYear': toYear,
-            'genre': genre, 'musicFolderId': musicFolderId})
+        q = _zipQuery(_ALBUM_LIST_PARAMS, (ltype, size, offset, fromYear,
+            toYear, genre, musicFolderId))
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        if 'album' not in dres['albumList']:
-            return []
-        return [Album(entry) for entry in dres['albumList']['album']]
+        return list(map(Album, self._streamInfoReq(methodName, q,
+            'albumList.album')))
 
 
     def getAlbumList2(self, ltype, size=10, offset=0, fromYear=None,
@@ -1132,16 +1281,11 @@ class Connection:
         """
         methodName = 'getAlbumList2'
 
-        q = self._getQueryDict({'type': ltype, 'size': size,
-            'offset': offset, 'fromYear': fromYear, 'toYear': toYear,
-            'genre': genre})
+        q = _zipQuery(_ALBUM_LIST2_PARAMS, (ltype, size, offset, fromYear,
+            toYear, genre))
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        if 'album' not in dres['albumList2']:
-            return []
-        return [Album(entry) for entry in dres['albumList2']['album']]
+        return list(map(Album, self._streamInfoReq(methodName, q,
+            'albumList2.album')))
 
 
     def getRandomSongs(self, size=10, genre=None, fromYear=None,
@@ -1162,14 +1306,11 @@ class Connection:
         """
         methodName = 'getRandomSongs'
 
-        q = self._getQueryDict({'size': size, 'genre': genre,
-            'fromYear': fromYear, 'toYear': toYear,
-            'musicFolderId': musicFolderId})
+        q = _zipQuery(_RANDOM_SONGS_PARAMS, (size, genre, fromYear, toYear,
+            musicFolderId))
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return [Song(entry) for entry in dres['randomSongs']['song']]
+        return list(map(Song, self._streamInfoReq(methodName, q,
+            'randomSongs.song')))
 
 
     def getLyrics(self, artist=None, title=None):
@@ -1195,10 +1336,7 @@ class Connection:
 
         q = self._getQueryDict({'artist': artist, 'title': title})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
     
 
     def getLyricsBySongId(self, song_id):
@@ -1251,10 +1389,7 @@ class Connection:
 
         q = self._getQueryDict({'id': song_id})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
 
 
     def jukeboxControl(self, action, index=None, sids=None, gain=None,
@@ -1292,18 +1427,15 @@ class Connection:
         q = self._getQueryDict({'action': action, 'index': index,
             'gain': gain, 'offset': offset})
 
-        res = None
-        if action == 'add':
-            # We have to deal with the sids
-            if not (isinstance(sids, list) or isinstance(sids, tuple)):
-                raise errors.ArgumentError('If you are adding songs, "sids" must '
-                    'be a list or tuple!')
-            res = self._doRequestWithList(methodName, 'id', sids, q)
-        else:
-            res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        if action != 'add':
+            return self._call(methodName, q)
+
+        # We have to deal with the sids
+        if not isinstance(sids, (list, tuple)):
+            raise errors.ArgumentError('If you are adding songs, "sids" must '
+                'be a list or tuple!')
+        q['id'] = sids
+        return self._call(methodName, q)
 
 
     def getPodcasts(self, incEpisodes=True, pid=None):
@@ -1324,10 +1456,8 @@ class Connection:
 
         q = self._getQueryDict({'includeEpisodes': incEpisodes,
             'id': pid})
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return [PodcastChannel(entry) for entry in dres['podcasts']['channel']]
+        return list(map(PodcastChannel, self._streamInfoReq(methodName, q,
+            'podcasts.channel')))
 
 
     def getShares(self):
@@ -1361,10 +1491,7 @@ class Connection:
         """
         methodName = 'getShares'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def createShare(self, shids=None, description=None, expires=None):
@@ -1390,14 +1517,11 @@ class Connection:
         """
         methodName = 'createShare'
 
-        if shids is None:
-            shids = []
-
         q = self._getQueryDict({'description': description,
-            'expires': self._ts2milli(expires)})
-        res = self._doRequestWithList(methodName, 'id', shids, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+            'expires': _ts2milli(expires)})
+        q['id'] = _asList(shids)
+        dres = self._call(methodName, q)
+        self._cacheEvict('getShares')
         return dres
 
 
@@ -1415,11 +1539,10 @@ class Connection:
         methodName = 'updateShare'
 
         q = self._getQueryDict({'id': shid, 'description': description,
-            expires: self._ts2milli(expires)})
+            'expires': _ts2milli(expires)})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
+        self._cacheEvict('getShares')
         return dres
 
 
@@ -1436,12 +1559,9 @@ class Connection:
         """
         methodName = 'deleteShare'
 
-        q = self._getQueryDict({'id': shid})
+        q = (('id', shid),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getShares',))
 
 
     def setRating(self, item_id, rating):
@@ -1459,21 +1579,19 @@ class Connection:
         """
         methodName = 'setRating'
 
-        try:
-            rating = int(rating)
-        except Exception as exc:
-            raise errors.ArgumentError('Rating must be an integer between 0 and 5: '
-                '%r' % rating) from exc
-        if rating < 0 or rating > 5:
+        if type(rating) is not int:
+            try:
+                rating = int(rating)
+            except Exception as exc:
+                raise errors.ArgumentError('Rating must be an integer between 0 and 5: '
+                    '%r' % rating) from exc
+        if not 0 <= rating <= 5:
             raise errors.ArgumentError('Rating must be an integer between 0 and 5: '
                 '%r' % rating)
 
-        q = self._getQueryDict({'id': item_id, 'rating': rating})
+        q = (('id', item_id), ('rating', rating))
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=_RATED_METHODS)
 
 
     def getArtists(self):
@@ -1487,11 +1605,8 @@ class Connection:
         """
         methodName = 'getArtists'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-
-        return [Index(entry) for entry in dres['artists']['index']]
+        return list(map(Index, self._streamInfoReq(methodName, None,
+            'artists.index')))
 
 
     def getArtist(self, artist_id):
@@ -1507,12 +1622,9 @@ class Connection:
         """
         methodName = 'getArtist'
 
-        q = self._getQueryDict({'id': artist_id})
+        q = (('id', artist_id),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return Artist(dres['artist'])
+        return Artist(self._call(methodName, q, extract='artist'))
 
 
     def getAlbum(self, album_id):
@@ -1528,12 +1640,9 @@ class Connection:
         """
         methodName = 'getAlbum'
 
-        q = self._getQueryDict({'id': album_id})
+        q = (('id', album_id),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return Album(dres['album'])
+        return Album(self._call(methodName, q, extract='album'))
 
 
     def getSong(self, sid):
@@ -1549,12 +1658,9 @@ class Connection:
         """
         methodName = 'getSong'
 
-        q = self._getQueryDict({'id': sid})
+        q = (('id', sid),)
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return Song(dres['song'])
+        return Song(self._call(methodName, q, extract='song'))
 
 
     def getVideos(self):
@@ -1583,10 +1689,7 @@ class Connection:
         """
         methodName = 'getVideos'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getStarred(self, musicFolderId=None):
@@ -1607,24 +1710,10 @@ class Connection:
         if musicFolderId:
             q['musicFolderId'] = musicFolderId
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        starred = dres['starred']
-        ret = {}
-        if 'artist' in starred:
-            ret['artists'] = [Artist(entry) for entry in starred['artist']]
-        else:
-            ret['artists'] = []
-        if 'album' in starred:
-            ret['albums'] = [Album(entry) for entry in starred['album']]
-        else:
-            ret['albums'] = []
-        if 'song' in starred:
-            ret['songs'] = [Song(entry) for entry in starred['song']]
-        else:
-            ret['songs'] = []
-        return ret
+        starred = self._call(methodName, q, extract='starred')
+        return {'artists': list(map(Artist, starred.get('artist', ()))),
+            'albums': list(map(Album, starred.get('album', ()))),
+            'songs': list(map(Song, starred.get('song', ())))}
 
 
     def getStarred2(self, musicFolderId=None):
@@ -1648,24 +1737,10 @@ class Connection:
         if musicFolderId:
             q['musicFolderId'] = musicFolderId
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        starred = dres['starred2']
-        ret = {}
-        if 'artist' in starred:
-            ret['artists'] = [Artist(entry) for entry in starred['artist']]
-        else:
-            ret['artists'] = []
-        if 'album' in starred:
-            ret['albums'] = [Album(entry) for entry in starred['album']]
-        else:
-            ret['albums'] = []
-        if 'song' in starred:
-            ret['songs'] = [Song(entry) for entry in starred['song']]
-        else:
-            ret['songs'] = []
-        return ret
+        starred = self._call(methodName, q, extract='starred2')
+        return {'artists': list(map(Artist, starred.get('artist', ()))),
+            'albums': list(map(Album, starred.get('album', ()))),
+            'songs': list(map(Song, starred.get('song', ())))}
 
 
     def updatePlaylist(self, lid, name=None, comment=None, songIdsToAdd=None, public=None,
@@ -1690,25 +1765,11 @@ class Connection:
         """
         methodName = 'updatePlaylist'
 
-        if songIdsToAdd is None:
-            songIdsToAdd = []
-
-        if songIndexesToRemove is None:
-            songIndexesToRemove = []
-
         q = self._getQueryDict({'playlistId': lid, 'name': name, 'public': public,
-            'comment': comment})
-        if not isinstance(songIdsToAdd, list) or isinstance(songIdsToAdd,
-                tuple):
-            songIdsToAdd = [songIdsToAdd]
-        if not isinstance(songIndexesToRemove, list) or isinstance(
-                songIndexesToRemove, tuple):
-            songIndexesToRemove = [songIndexesToRemove]
-        listMap = {'songIdToAdd': songIdsToAdd,
-            'songIndexToRemove': songIndexesToRemove}
-        res = self._doRequestWithLists(methodName, listMap, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+            'comment': comment, 'songIdToAdd': _asList(songIdsToAdd),
+            'songIndexToRemove': _asList(songIndexesToRemove)})
+        res = self._doRequest(methodName, q, timeout=_LIST_TIMEOUT)
+        self._handleInfoRes(res)
         return True
 
 
@@ -1721,13 +1782,15 @@ class Connection:
         username:str    The user to retrieve the avatar for
 
         Returns the requests.Response object for reading on success or raises
-        and exception
+        and exception.  The body is streamed, so use iter_content() or raw to
+        copy it somewhere without holding it all in memory, or content to get
+        the whole image at once
         """
         methodName = 'getAvatar'
 
         q = {'username': username}
 
-        res = self._doRequest(methodName, q)
+        res = self._doRequest(methodName, q, is_stream=True)
         dres = self._handleBinRes(res)
         if isinstance(dres, dict):
             self._checkStatus(dres)
@@ -1738,7 +1801,9 @@ class Connection:
         """
         since 1.8.0
 
-        Attaches a star to songs, albums or artists
+        Attaches a star to songs, albums or artists.  All of the ids are
+        sent in a single request, so prefer passing the full lists at once
+        over calling this in a loop (see starMany() for very long lists)
 
         sids:list       A list of song IDs to star
         albumIds:list   A list of album IDs to star.  Use this rather than
@@ -1755,25 +1820,12 @@ class Connection:
         """
         methodName = 'star'
 
-        if sids is None:
-            sids = []
-        if albumIds is None:
-            albumIds = []
-        if artistIds is None:
-            artistIds = []
-
-        if not isinstance(sids, list) or isinstance(sids, tuple):
-            sids = [sids]
-        if not isinstance(albumIds, list) or isinstance(albumIds, tuple):
-            albumIds = [albumIds]
-        if not isinstance(artistIds, list) or isinstance(artistIds, tuple):
-            artistIds = [artistIds]
-        listMap = {'id': sids,
-            'albumId': albumIds,
-            'artistId': artistIds}
-        res = self._doRequestWithLists(methodName, listMap)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        q = {'id': _asList(sids),
+            'albumId': _asList(albumIds),
+            'artistId': _asList(artistIds)}
+        res = self._doRequest(methodName, q, timeout=_LIST_TIMEOUT)
+        self._handleInfoRes(res)
+        self._cacheEvict(*_RATED_METHODS)
         return True
 
 
@@ -1782,7 +1834,7 @@ class Connection:
         since 1.8.0
 
         Removes a star to songs, albums or artists.  Basically, the
-        same as star in reverse
+        same as star in reverse (see unstarMany() for very long lists)
 
         sids:list       A list of song IDs to star
         albumIds:list   A list of album IDs to star.  Use this rather than
@@ -1799,28 +1851,41 @@ class Connection:
         """
         methodName = 'unstar'
 
-        if sids is None:
-            sids = []
-        if albumIds is None:
-            albumIds = []
-        if artistIds is None:
-            artistIds = []
-
-        if not isinstance(sids, list) or isinstance(sids, tuple):
-            sids = [sids]
-        if not isinstance(albumIds, list) or isinstance(albumIds, tuple):
-            albumIds = [albumIds]
-        if not isinstance(artistIds, list) or isinstance(artistIds, tuple):
-            artistIds = [artistIds]
-        listMap = {'id': sids,
-            'albumId': albumIds,
-            'artistId': artistIds}
-        res = self._doRequestWithLists(methodName, listMap)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        q = {'id': _asList(sids),
+            'albumId': _asList(albumIds),
+            'artistId': _asList(artistIds)}
+        res = self._doRequest(methodName, q, timeout=_LIST_TIMEOUT)
+        self._handleInfoRes(res)
+        self._cacheEvict(*_RATED_METHODS)
         return True
 
 
+    def starMany(self, sids=None, albumIds=None, artistIds=None,
+            chunkSize=500):
+        """
+        Like star(), but splits very long id lists over as few requests of
+        at most chunkSize ids (per list) as possible, keeping each request
+        within the size limits of servers and proxies
+
+        chunkSize:int   The most ids of each kind sent in one request
+
+        Returns True on success, raises a errors.SonicError or subclass on
+        failure.
+        """
+        return self._chunkedStar(self.star, sids, albumIds, artistIds,
+            chunkSize)
+
+
+    def unstarMany(self, sids=None, albumIds=None, artistIds=None,
+            chunkSize=500):
+        """
+        Like unstar(), but splits very long id lists over several requests,
+        see starMany()
+        """
+        return self._chunkedStar(self.unstar, sids, albumIds, artistIds,
+            chunkSize)
+
+
     def getGenres(self):
         """
         since 1.9.0
@@ -1829,10 +1894,7 @@ class Connection:
         """
         methodName = 'getGenres'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getSongsByGenre(self, genre, count=10, offset=0, musicFolderId=None):
@@ -1856,10 +1918,8 @@ class Connection:
             'musicFolderId': musicFolderId,
         })
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return [Song(entry) for entry in dres['songsByGenre']['song']]
+        return list(map(Song, self._call(methodName, q,
+            extract='songsByGenre.song')))
 
 
     def hls (self, mid, bitrate=None):
@@ -1895,7 +1955,9 @@ class Connection:
         dres = self._handleBinRes(res)
         if isinstance(dres, dict):
             self._checkStatus(dres)
-        return dres.read()
+            raise ValueError('Expected an m3u8 playlist from hls, got a JSON '
+                'response')
+        return dres.text
 
 
     def refreshPodcasts(self):
@@ -1910,10 +1972,7 @@ class Connection:
         """
         methodName = 'refreshPodcasts'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, evicts=('getPodcasts',))
 
 
     def createPodcastChannel(self, url):
@@ -1932,10 +1991,7 @@ class Connection:
 
         q = {'url': url}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getPodcasts',))
 
 
     def deletePodcastChannel(self, pid):
@@ -1954,10 +2010,7 @@ class Connection:
 
         q = {'id': pid}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getPodcasts',))
 
 
     def deletePodcastEpisode(self, pid):
@@ -1976,10 +2029,7 @@ class Connection:
 
         q = {'id': pid}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getPodcasts',))
 
 
     def downloadPodcastEpisode(self, pid):
@@ -1998,10 +2048,7 @@ class Connection:
 
         q = {'id': pid}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q, evicts=('getPodcasts',))
 
 
     def getInternetRadioStations(self):
@@ -2012,10 +2059,7 @@ class Connection:
         """
         methodName = 'getInternetRadioStations'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def createInternetRadioStation(self, streamUrl, name, homepageUrl=None):
@@ -2033,9 +2077,8 @@ class Connection:
         q = self._getQueryDict({
             'streamUrl': streamUrl, 'name': name, 'homepageUrl': homepageUrl})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
+        self._cacheEvict('getInternetRadioStations')
         return dres
 
 
@@ -2058,9 +2101,8 @@ class Connection:
             'homepageUrl': homepageUrl,
         })
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
+        self._cacheEvict('getInternetRadioStations')
         return dres
 
 
@@ -2076,9 +2118,8 @@ class Connection:
 
         q = {'id': iid}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
+        self._cacheEvict('getInternetRadioStations')
         return dres
 
 
@@ -2091,10 +2132,7 @@ class Connection:
         """
         methodName = 'getBookmarks'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def createBookmark(self, mid, position, comment=None):
@@ -2117,10 +2155,7 @@ class Connection:
         q = self._getQueryDict({'id': mid, 'position': position,
             'comment': comment})
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q)
 
 
     def deleteBookmark(self, mid):
@@ -2139,10 +2174,7 @@ class Connection:
 
         q = {'id': mid}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return True
+        return self._simple(methodName, q)
 
 
     def getArtistInfo(self, aid, count=20, includeNotPresent=False):
@@ -2162,10 +2194,7 @@ class Connection:
         q = {'id': aid, 'count': count,
             'includeNotPresent': includeNotPresent}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return ArtistInfo(dres['artistInfo'])
+        return ArtistInfo(self._call(methodName, q, extract='artistInfo'))
 
 
     def getArtistInfo2(self, aid, count=20, includeNotPresent=False):
@@ -2184,10 +2213,7 @@ class Connection:
         q = {'id': aid, 'count': count,
             'includeNotPresent': includeNotPresent}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return ArtistInfo(dres['artistInfo2'])
+        return ArtistInfo(self._call(methodName, q, extract='artistInfo2'))
 
 
     def getSimilarSongs(self, iid, count=50):
@@ -2205,9 +2231,7 @@ class Connection:
 
         q = {'id': iid, 'count': count}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         if 'similarSongs' not in dres or 'song' not in dres['similarSongs']:
             return []
         return [Song(entry) for entry in dres['similarSongs']['song']]
@@ -2227,9 +2251,7 @@ class Connection:
 
         q = {'id': iid, 'count': count}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         if 'similarSongs2' not in dres or 'song' not in dres['similarSongs2']:
             return []
         return [Song(entry) for entry in dres['similarSongs2']['song']]
@@ -2252,15 +2274,11 @@ class Connection:
         """
         methodName = 'savePlayQueue'
 
-        if not isinstance(qids, (tuple, list)):
-            qids = [qids]
-
-        q = self._getQueryDict({'current': current, 'position': position})
+        q = self._getQueryDict({'current': current, 'position': position,
+            'id': _asList(qids)})
 
-        res = self._doRequestWithLists(methodName, {'id': qids}, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        res = self._doRequest(methodName, q, timeout=_LIST_TIMEOUT)
+        return self._handleInfoRes(res)
 
 
     def getPlayQueue(self):
@@ -2276,10 +2294,7 @@ class Connection:
         """
         methodName = 'getPlayQueue'
 
-        res = self._doRequest(methodName)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName)
 
 
     def getTopSongs(self, artist, count=50):
@@ -2295,9 +2310,7 @@ class Connection:
 
         q = {'artist': artist, 'count': count}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         if 'topSongs' not in dres or 'song' not in dres['topSongs']:
             return []
         return [Song(entry) for entry in dres['topSongs']['song']]
@@ -2315,9 +2328,7 @@ class Connection:
 
         q = {'count': count}
 
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
+        dres = self._call(methodName, q)
         if 'newestPodcasts' not in dres or 'episode' not in dres['newestPodcasts']:
             return []
         return [PodcastEpisode(entry) for entry in dres['newestPodcasts']['episode']]
@@ -2335,10 +2346,7 @@ class Connection:
         methodName = 'getVideoInfo'
 
         q = {'id': int(vid)}
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
 
 
     def getAlbumInfo(self, aid):
@@ -2354,10 +2362,7 @@ class Connection:
         methodName = 'getAlbumInfo'
 
         q = {'id': aid}
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return AlbumInfo(dres['albumInfo'])
+        return AlbumInfo(self._call(methodName, q, extract='albumInfo'))
 
 
     def getAlbumInfo2(self, aid):
@@ -2373,10 +2378,7 @@ class Connection:
         methodName = 'getAlbumInfo2'
 
         q = {'id': aid}
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return AlbumInfo(dres['albumInfo'])
+        return AlbumInfo(self._call(methodName, q, extract='albumInfo'))
 
 
     def getCaptions(self, vid, fmt=None):
@@ -2392,145 +2394,294 @@ class Connection:
         methodName = 'getCaptions'
 
         q = self._getQueryDict({'id': int(vid), 'format': fmt})
-        res = self._doRequest(methodName, q)
-        dres = self._handleInfoRes(res)
-        self._checkStatus(dres)
-        return dres
+        return self._call(methodName, q)
+
+
+    def getAlbumsBulk(self, album_ids):
+        """
+        Fetches several albums at once.  The Subsonic API has no batch
+        endpoint, so this issues one getAlbum call per ID and runs them
+        concurrently over the pooled connection.
+
+        album_ids:list      The album IDs to fetch
+
+        Returns a list of media.Album in the same order as album_ids
+        """
+        return self._bulk(self.getAlbum, album_ids)
+
+
+    def getSongsBulk(self, song_ids):
+        """
+        Like getAlbumsBulk, but for getSong
+
+        song_ids:list       The song IDs to fetch
+
+        Returns a list of media.Song in the same order as song_ids
+        """
+        return self._bulk(self.getSong, song_ids)
+
+
+    def getArtistsBulk(self, artist_ids):
+        """
+        Like getAlbumsBulk, but for getArtist
+
+        artist_ids:list     The artist IDs to fetch
+
+        Returns a list of media.Artist in the same order as artist_ids
+        """
+        return self._bulk(self.getArtist, artist_ids)
+
+
+    def getLyricsBulk(self, song_ids):
+        """
+        Like getAlbumsBulk, but for getLyricsBySongId
+
+        song_ids:list       The song IDs to fetch lyrics for
+
+        Returns a list of getLyricsBySongId results in the same order as
+        song_ids
+        """
+        return self._bulk(self.getLyricsBySongId, song_ids)
 
 
     #
     # Private internal methods
     #
-    def _getOpener(self, username, passwd):
-        return urllib.request.build_opener()
+    def _chunkedStar(self, func, sids, albumIds, artistIds, chunkSize):
+        lists = [_asList(x) for x in (sids, albumIds, artistIds)]
+        for i in range(0, max(map(len, lists)), chunkSize):
+            func(*(x[i:i + chunkSize] for x in lists))
+        return True
+
+
+    def _bulk(self, func, ids):
+        """
+        Calls func once for each of the ids, with up to poolSize calls in
+        flight at a time, and returns the results in order
+        """
+        ids = list(ids)
+        if not ids:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self._poolSize, len(ids))) as ex:
+            return list(ex.map(func, ids))
+
 
     def _getQueryDict(self, d):
         """
         Given a dictionary, it cleans out all the values set to None
         """
-        for k, v in list(d.items()):
-            if v is None:
-                del d[k]
-        return d
+        return {k: v for k, v in d.items() if v is not None}
 
 
     def _getBaseQdict(self):
-        qdict = {
-            'f': 'json',
-            'v': self._apiVersion,
-            'c': self._appName,
-            'u': self._username,
-        }
-
-        if self._legacyAuth:
-            qdict['p'] = 'enc:%s' % self._hexEnc(self._rawPass)
-        else:
-            if self._rawPass:
+        # The base query only changes when one of the property setters is
+        # used, so build it once and hand out copies.  With a raw password
+        # the salt and token are generated here too and rotated every
+        # _SALT_LIFETIME seconds rather than per request; the server accepts
+        # any salt it is given.  The dict is replaced, never modified, so
+        # threads sharing the connection can't see a half built one
+        if self._baseQdict is None or self._baseQdictExpiry < time.monotonic():
+            qdict = {
+                'f': 'json',
+                'v': self._apiVersion,
+                'c': self._appName,
+                'u': self._username,
+            }
+            expiry = float('inf')
+            if self._legacyAuth:
+                qdict['p'] = 'enc:%s' % self._hexEnc(self._rawPass)
+            elif self._rawPass:
                 salt = self._getSalt()
-                token = md5((self._rawPass + salt).encode('utf-8')).hexdigest()
+                qdict['s'] = salt
+                qdict['t'] = md5((self._rawPass + salt).encode('utf-8')).hexdigest()
+                expiry = time.monotonic() + _SALT_LIFETIME
             else:
-                salt = self._salt
-                token = self._token
-            qdict.update({
-                's': salt,
-                't': token,
-            })
+                qdict['s'] = self._salt
+                qdict['t'] = self._token
+            self._baseQdictExpiry = expiry
+            self._baseQdict = qdict
+        return self._baseQdict.copy()
+
 
-        return qdict
+    def _getUrl(self, methodName):
+        # The prefix is rebuilt only after the base url, port or server path
+        # change
+        if self._urlPrefix is None:
+            self._urlPrefix = f"{self._baseUrl}:{self._port}/{self._serverPath}/"
+        return self._urlPrefix + methodName + self._methodSuffix
 
 
-    def _doRequest(self, methodName, query=None, is_stream=False):
+    def _doRequest(self, methodName, query=None, is_stream=False,
+            timeout=_TIMEOUT):
+        """
+        query may be a dict or, for calls with a fixed handful of
+        parameters, a tuple of (name, value) pairs.  None values are
+        not sent, booleans are sent as the lower case strings the API
+        expects and list values are sent as the same parameter repeated
+        once per item (e.g. id=1&id=2).
+        """
         qdict = self._getBaseQdict()
         if query is not None:
-            qdict.update(query)
+            for k, v in (query.items() if isinstance(query, dict) else query):
+                qdict[k] = ('true' if v else 'false') if isinstance(v, bool) else v
 
-        if self._useViews:
-            methodName += '.view'
-        url = f"{self._baseUrl}:{self._port}/{self._serverPath}/{methodName}"
+        url = self._getUrl(methodName)
+        # Only override certificate checks when asked to; otherwise leave it
+        # to the session, which may carry its own CA bundle
+        verify = False if self._insecure else None
 
+        # POST keeps long id lists out of the url; GET is only for servers
+        # that can't handle it
         if self._useGET:
-            res = requests.get(url, params=qdict, stream=is_stream, timeout=(30, 60))
-        else:
-            res = requests.post(url, data=qdict, stream=is_stream, timeout=(30, 60))
-
-        return res
+            return self._session.request('GET', url, params=qdict,
+                stream=is_stream, verify=verify, timeout=timeout)
+        return self._session.request('POST', url, data=qdict,
+            stream=is_stream, verify=verify, timeout=timeout)
 
 
-    def _doRequestWithList(self, methodName, listName, alist, query=None):
+    def _call(self, methodName, query=None, extract=None):
         """
-        Like _getRequest, but allows appending a number of items with the
-        same key (listName).  This bypasses the limitation of urlencode()
+        Runs an info request and returns the parsed response, or just the
+        part of it found at extract (a key, or a dotted path of keys such as
+        'randomSongs.song').  Read only calls are served from the response
+        cache when it is enabled.  The cache holds the raw response body and
+        parses it again on every hit, so callers never share (or modify) a
+        cached result.
         """
-        qdict = self._getBaseQdict()
-        if query is not None:
-            qdict.update(query)
-        qdict[listName] = alist
-
-        if self._useViews:
-            methodName += '.view'
-        url = f"{self._baseUrl}:{self._port}/{self._serverPath}/{methodName}"
-
-        if self._useGET:
-            res = requests.get(url, params=qdict, timeout=(30, 60))
+        if self._cache is None or methodName not in _CACHED_METHODS:
+            dres = self._handleInfoRes(self._doRequest(methodName, query))
         else:
-            res = requests.post(url, data=qdict, timeout=(30, 60))
+            if not query:
+                key = (methodName, ())
+            elif isinstance(query, tuple):
+                key = (methodName, query)
+            else:
+                key = (methodName, tuple(sorted(query.items())))
+            body = self._cache.get(key)
+            if body is None:
+                # A write that evicts while this request is in flight makes
+                # the response stale, so it is only stored if none did
+                generation = self._cache.generation
+                res = self._doRequest(methodName, query)
+                dres = self._handleInfoRes(res)
+                self._cache.set(key, res.content, generation)
+            else:
+                dres = _json.loads(body)['subsonic-response']
 
-        return res
+        if extract is not None:
+            for name in extract.split('.'):
+                dres = dres[name]
+        return dres
 
 
-    def _doRequestWithLists(self, methodName, listMap, query=None):
+    def _simple(self, methodName, query=None, evicts=()):
         """
-        Like _getRequestWithList(), but you must pass a dictionary
-        that maps the listName to the list.  This allows for multiple
-        list parameters to be used, like in updatePlaylist()
-
-        methodName:str        The name of the method
-        listMap:dict        A mapping of listName to a list of entries
-        query:dict          The normal query dict
+        Runs a call whose only result is success or an exception, drops the
+        cached responses of the evicts methods it makes stale and returns
+        True
         """
-        qdict = self._getBaseQdict()
-        if query is not None:
-            qdict.update(query)
-        qdict.update(listMap)
+        self._call(methodName, query)
+        if evicts:
+            self._cacheEvict(*evicts)
+        return True
 
-        if self._useViews:
-            methodName += '.view'
 
-        url = f"{self._baseUrl}:{self._port}/{self._serverPath}/{methodName}"
+    def _cacheEvict(self, *methodNames):
+        if self._cache is not None:
+            self._cache.evict(*methodNames)
 
-        if self._useGET:
-            res = requests.get(url, params=qdict, timeout=(60,300))
-        else:
-            res = requests.post(url, data=qdict, timeout=(60,300))
 
-        return res
+    def _handleInfoRes(self, res):
+        # Returns a parsed dictionary version of the result, raising the
+        # matching SonicError if the server reports a failure and ValueError
+        # if the body isn't a Subsonic response at all
+        res.raise_for_status()
+        body = _json.loads(res.content)
+        dres = body.get('subsonic-response') if isinstance(body, dict) else None
+        if dres is None:
+            raise ValueError('Response is not a Subsonic API response')
+        if dres.get('status') != _STATUS_OK:
+            self._checkStatus(dres)
+        return dres
 
 
-    def _handleInfoRes(self, res):
-        # Returns a parsed dictionary version of the result
+    def _streamInfoReq(self, methodName, query, path):
+        """
+        Returns an iterator over the entries found at path (for example
+        'albumList.album') in the response to methodName.
+
+        When ijson is installed each entry is decoded as it is read off the
+        wire, so building media objects from a large list never needs the
+        raw body, the whole parsed response and the objects all at once.
+        Without it, or when the response is going to the cache, this is a
+        normal parse.
+        """
+        if ijson is None or (self._cache is not None and
+                methodName in _CACHED_METHODS):
+            parent, key = path.split('.')
+            return iter(self._call(methodName, query, parent).get(key, ()))
+        return self._iterStreamedItems(
+            self._doRequest(methodName, query, is_stream=True), path)
+
+
+    def _iterStreamedItems(self, res, path):
+        # Yields each object under path as it is parsed.  The status is only
+        # known for certain once the whole body is read, so a failed call
+        # raises at the end of the iteration.  Errors are raised as the
+        # buffered _handleInfoRes() would: ValueError for a body that isn't
+        # a valid Subsonic response, SonicError for a failed call
         res.raise_for_status()
-        dres = res.json()
-        return dres['subsonic-response']
+        res.raw.decode_content = True
+        itemPrefix = f'subsonic-response.{path}.item'
+        errPrefix = 'subsonic-response.error'
+        status = None
+        error = None
+        builder = None
+        try:
+            for prefix, event, value in ijson.parse(res.raw, use_float=True):
+                if builder is None:
+                    if event == 'start_map' and prefix in (itemPrefix, errPrefix):
+                        target = prefix
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    elif prefix == 'subsonic-response.status':
+                        status = value
+                    continue
+                builder.event(event, value)
+                if event == 'end_map' and prefix == target:
+                    if target == itemPrefix:
+                        yield builder.value
+                    else:
+                        error = builder.value
+                    builder = None
+        except ijson.JSONError as e:
+            raise ValueError(f'Invalid response body: {e}') from e
+        finally:
+            res.close()
+        if status != _STATUS_OK:
+            self._checkStatus({'status': status, 'error': error})
 
 
     def _handleBinRes(self, res):
         res.raise_for_status()
-        contType = res.headers['Content-Type'] if 'Content-Type' in res.headers else None
+        contType = res.headers.get('Content-Type')
 
         if contType:
             if contType.startswith('text/html') or \
                     contType.startswith('application/json'):
-                dres = res.json()
-                return dres['subsonic-response']
+                return _json.loads(res.content)['subsonic-response']
         return res
 
 
     def _checkStatus(self, result):
-        if result['status'] == 'ok':
+        status = result.get('status')
+        if status == _STATUS_OK:
             return True
-        elif result['status'] == 'failed':
-            exc = errors.getExcByCode(result['error']['code'])
-            raise exc(result['error']['message'])
+        elif status == 'failed':
+            err = result['error']
+            raise errors.getExcByCode(err['code'])(err['message'])
+        # Not something the server would send, e.g. a proxy's own JSON page
+        raise ValueError(f'Unexpected response status {status!r}')
 
 
     def _hexEnc(self, raw):
@@ -2539,41 +2690,7 @@ class Connection:
 
         raw:str     The string to hex encode
         """
-        ret = ''
-        for c in raw:
-            ret += '%02X' % ord(c)
-        return ret
-
-
-    def _ts2milli(self, ts):
-        """
-        For whatever reason, Subsonic uses timestamps in milliseconds since
-        the unix epoch.  I have no idea what need there is of this precision,
-        but this will just multiply the timestamp times 1000 and return the int
-        """
-        if ts is None:
-            return None
-        return int(ts * 1000)
-
-
-    def _fixLastModified(self, data):
-        """
-        This will recursively walk through a data structure and look for
-        a dict key/value pair where the key is "lastModified" and change
-        the shitty java millisecond timestamp to a real unix timestamp
-        of SECONDS since the unix epoch.  JAVA SUCKS!
-        """
-        if isinstance(data, dict):
-            for k, v in list(data.items()):
-                if k == 'lastModified':
-                    data[k] = int(v) / 1000.0
-                    return
-                elif isinstance(v, (tuple, list, dict)):
-                    return self._fixLastModified(v)
-        elif isinstance(data, (list, tuple)):
-            for item in data:
-                if isinstance(item, (list, tuple, dict)):
-                    return self._fixLastModified(item)
+        return raw.encode('utf-8').hex().upper()
 
 
     def _process_netrc(self, use_netrc):
@@ -2591,10 +2708,10 @@ class Connection:
                 'or a string representing a path to a netrc file, '
                 'not {0}'.format(repr(use_netrc)))
         if isinstance(use_netrc, bool) and use_netrc:
-            self._netrc = netrc()
+            self._netrc = _loadNetrc()
         else:
             # This should be a string specifying a path to a netrc file
-            self._netrc = netrc(os.path.expanduser(use_netrc))
+            self._netrc = _loadNetrc(use_netrc)
         auth = self._netrc.authenticators(self._hostname)
         if not auth:
             raise errors.CredentialError('No machine entry found for {0} in '
@@ -2606,6 +2723,5 @@ class Connection:
 
 
     def _getSalt(self, length=16):
-        salt = md5(os.urandom(100)).hexdigest()
-        return salt[:length]
+        return secrets.token_hex((length + 1) // 2)[:length]
 
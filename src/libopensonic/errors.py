@@ -70,7 +70,4 @@ def getExcByCode(code):
     Returns a typed error if we can match the code, otherwise
     return SonicError.
     """
-    code = int(code)
-    if code in ERR_CODE_MAP:
-        return ERR_CODE_MAP[code]
-    return SonicError
+    return ERR_CODE_MAP.get(int(code), SonicError)
@@ -15,85 +15,91 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase, _lazy_children, _required
 from . import song
 
 class AlbumInfo:
+    __slots__ = ('_notes', '_mb_id', '_lastfm_url', '_small_url', '_med_url',
+        '_large_url')
+
     def __init__(self, info):
-        self._notes = get_key(info, 'notes', '')
-        self._mb_id = get_key(info, 'musicBrainzId', '')
-        self._lastfm_url = get_key(info, 'lastFmUrl', '')
-        self._small_url = get_key(info, 'smallImageUrl', '')
-        self._med_url = get_key(info, 'mediumImageUrl', '')
-        self._large_url = get_key(info, 'largeImageUrl', '')
+        self._notes = info.get('notes', '')
+        self._mb_id = info.get('musicBrainzId', '')
+        self._lastfm_url = info.get('lastFmUrl', '')
+        self._small_url = info.get('smallImageUrl', '')
+        self._med_url = info.get('mediumImageUrl', '')
+        self._large_url = info.get('largeImageUrl', '')
     
-    notes = property(lambda s: s._notes)
-    mb_id = property(lambda s: s._mb_id)
-    small_url = property(lambda s: s._small_url)
-    med_url = property(lambda s: s._med_url)
-    large_url = property(lambda s:s._large_url)        
+    notes = property(attrgetter('_notes'))
+    mb_id = property(attrgetter('_mb_id'))
+    small_url = property(attrgetter('_small_url'))
+    med_url = property(attrgetter('_med_url'))
+    large_url = property(attrgetter('_large_url'))        
 
 
 class Album(MediaBase):
+    __slots__ = ('_parent', '_album', '_name', '_is_dir', '_song_count', '_created',
+        '_duration', '_play_count', '_artist_id', '_artist', '_year', '_genre',
+        '_played', '_user_rating', '_songs', '_songs_raw', '_info', '_mb_id')
+
+    _OPTIONAL_FIELDS = (
+        ('_parent', 'parent', None),
+        ('_album', 'album', None),
+        ('_is_dir', 'isDir', None),
+        ('_play_count', 'playCount', None),
+        ('_artist_id', 'artistId', None),
+        ('_artist', 'artist', None),
+        ('_year', 'year', None),
+        ('_genre', 'genre', None),
+        ('_played', 'played', None),
+        ('_user_rating', 'userRating', None),
+    )
+    _DICT_FIELDS = (
+        ('_name', 'name'),
+        ('_song_count', 'songCount'),
+        ('_created', 'created'),
+        ('_duration', 'duration'),
+    )
+
     def __init__(self, info):
-        self._parent = get_key(info, 'parent')
-        self._album = get_key(info, 'album')
-        self._name = self.get_required_key(info, 'name', '')
-        self._is_dir = get_key(info, 'isDir')
-        self._song_count = int(self.get_required_key(info, 'songCount', 0))
-        self._created = self.get_required_key(info, 'created')
-        self._duration = int(self.get_required_key(info, 'duration', 0))
-        self._play_count = get_key(info, 'playCount')
-        self._artist_id = get_key(info, 'artistId')
-        self._artist = get_key(info, 'artist')
-        self._year = get_key(info, 'year')
-        self._genre = get_key(info, 'genre')
-        self._played = get_key(info, 'played')
-        self._user_rating = get_key(info, 'userRating')
-        self._songs = []
+        self._load_optional(info)
+        self._name = _required(info, 'name', 'Album', '')
+        self._song_count = int(_required(info, 'songCount', 'Album', 0))
+        self._created = _required(info, 'created', 'Album')
+        self._duration = int(_required(info, 'duration', 'Album', 0))
+        self._songs = None
+        self._songs_raw = info.get('song')
         self._info = None
-        if 'song' in info and info['song']:
-            for entry in info['song']:
-                self._songs.append(song.Song(entry))
+        self._mb_id = ''
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['album'] = self._album
-        ret['name'] = self._name
-        ret['isDir'] = self._is_dir
-        ret['songCount'] = self._song_count
-        ret['created'] = self._created
-        ret['duration'] = self._duration
-        ret['playCount'] = self._play_count
-        ret['artistId'] = self._artist_id
-        ret['artist'] = self._artist
-        ret['year'] = self._year
-        ret['genre'] = self._genre
-        ret['played'] = self._played
-        ret['userRating'] = self._user_rating
-        ret['parent'] = self._parent
-        if self._songs:
-            ret['song'] = [entry.to_dict() for entry in self._songs]
+    def to_dict(self, skip_none=False):
+        ret = self._fields_dict(skip_none)
+        if self.songs:
+            ret['song'] = [entry.to_dict(skip_none) for entry in self._songs]
         return ret
 
-    parent = property(lambda s: s._parent)
-    album = property(lambda s: s._album)
-    name = property(lambda s: s._name)
-    is_dir = property(lambda s: s._is_dir)
-    song_count = property(lambda s: s._song_count)
-    created = property(lambda s: s._created)
-    duration = property(lambda s: s._duration)
-    play_count = property(lambda s: s._play_count)
-    artist_id = property(lambda s: s._artist_id)
-    artist = property(lambda s: s._artist)
-    year = property(lambda s: s._year)
-    played = property(lambda s: s._played)
-    user_rating = property(lambda s: s._user_rating)
-    genre = property(lambda s: s._genre)
-    songs = property(lambda s: s._songs)
-    mb_id = property(lambda s: s._info.mb_id if s._info is not None else '')
+    parent = property(attrgetter('_parent'))
+    album = property(attrgetter('_album'))
+    name = property(attrgetter('_name'))
+    is_dir = property(attrgetter('_is_dir'))
+    song_count = property(attrgetter('_song_count'))
+    created = property(attrgetter('_created'))
+    duration = property(attrgetter('_duration'))
+    play_count = property(attrgetter('_play_count'))
+    artist_id = property(attrgetter('_artist_id'))
+    artist = property(attrgetter('_artist'))
+    year = property(attrgetter('_year'))
+    played = property(attrgetter('_played'))
+    user_rating = property(attrgetter('_user_rating'))
+    genre = property(attrgetter('_genre'))
+    songs = _lazy_children('_songs', lambda entry: song.Song(entry))
+    mb_id = property(attrgetter('_mb_id'))
 
     def set_info(self, info):
-        self._info = AlbumInfo(info)
-    info = property(lambda s: s._info, set_info)
+        if not isinstance(info, AlbumInfo):
+            info = AlbumInfo(info)
+        self._info = info
+        self._mb_id = info.mb_id
+    info = property(attrgetter('_info'), set_info)
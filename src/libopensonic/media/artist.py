@@ -15,26 +15,28 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase, _drop_none, _lazy_children, _required
 from .album import Album
 
 class ArtistInfo:
     """
     Holds extra (optional) artist info
     """
+    __slots__ = ('_biography', '_mb_id', '_small_url', '_med_url', '_large_url',
+        '_lastfm_url', '_similar_artists', '_similar_artists_raw')
+
     def __init__(self, info):
-        self._biography = get_key(info, 'biography', '')
-        self._mb_id = get_key(info, 'musicBrainzId', '')
-        self._small_url = get_key(info, 'smallImageUrl', '')
-        self._med_url = get_key(info, 'mediumImageUrl', '')
-        self._large_url = get_key(info, 'largeImageUrl', '')
-        self._lastfm_url = get_key(info, 'lastFmUrl', '')
-        self._similar_artists = []
-        if 'similarArtists' in info:
-            for entry in info['similarArtists']:
-                self._similar_artists.append(Artist(entry))
+        self._biography = info.get('biography', '')
+        self._mb_id = info.get('musicBrainzId', '')
+        self._small_url = info.get('smallImageUrl', '')
+        self._med_url = info.get('mediumImageUrl', '')
+        self._large_url = info.get('largeImageUrl', '')
+        self._lastfm_url = info.get('lastFmUrl', '')
+        self._similar_artists = None
+        self._similar_artists_raw = info.get('similarArtists')
 
-    def to_dict(self):
+    def to_dict(self, skip_none=False):
         ret = {
             'biography': self._biography,
             'musicBrainzId': self._mb_id,
@@ -43,23 +45,36 @@ class ArtistInfo:
             'largeImageUrl': self._large_url,
             'lastFmUrl': self._lastfm_url
         }
-        if self._similar_artists:
-            ret['similarArtists'] = [entry.to_dict() for entry in self._similar_artists]
-        return ret
+        if self.similar_artists:
+            ret['similarArtists'] = [entry.to_dict(skip_none) for entry in self._similar_artists]
+        return _drop_none(ret) if skip_none else ret
     
-    biography = property(lambda s: s._biography)
-    mb_id = property(lambda s: s._mb_id)
-    small_url = property(lambda s: s._small_url)
-    med_url = property(lambda s: s._med_url)
-    large_url = property(lambda s:s._large_url)
-    lastfm_url = property(lambda s:s._lastfm_url)
-    similar_artists = property(lambda s:s._similar_artists)
+    biography = property(attrgetter('_biography'))
+    mb_id = property(attrgetter('_mb_id'))
+    small_url = property(attrgetter('_small_url'))
+    med_url = property(attrgetter('_med_url'))
+    large_url = property(attrgetter('_large_url'))
+    lastfm_url = property(attrgetter('_lastfm_url'))
+    similar_artists = _lazy_children('_similar_artists', lambda entry: Artist(entry))
 
 
 class Artist(MediaBase):
     """
     A subsonic Artist
     """
+    __slots__ = ('_album_count', '_name', '_info', '_artist_image_url', '_sort_name',
+        '_roles', '_albums', '_albums_raw', '_mb_id')
+
+    _OPTIONAL_FIELDS = (
+        ('_album_count', 'albumCount', None),
+        ('_artist_image_url', 'artistImageUrl', None),
+        ('_sort_name', 'sortName', None),
+        ('_roles', 'roles', None),
+    )
+    _DICT_FIELDS = (
+        ('_name', 'name'),
+    )
+
     def __init__(self, info):
         """
         Builds an Artist object
@@ -69,40 +84,31 @@ class Artist(MediaBase):
                                     'albumCount', and 'album' though 'album'
                                     is a list and can be an empty one
         """
-        self._album_count = get_key(info, 'albumCount')
-        self._name = self.get_required_key(info, 'name', '')
+        self._load_optional(info)
+        self._name = _required(info, 'name', 'Artist', '')
         self._info = None
-        self._artist_image_url = get_key(info, 'artistImageUrl')
-        self._sort_name = get_key(info, 'sortName')
-        self._roles = get_key(info, 'roles')
-        self._albums = []
-        if 'album' in info and info['album']:
-            for entry in info['album']:
-                self._albums.append(Album(entry))
+        self._mb_id = ''
+        self._albums = None
+        self._albums_raw = info.get('album')
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['albumCount'] = self._album_count
-        ret['sortName'] = self._sort_name
-        ret['name'] = self._name
-        ret['artistImageUrl'] = self._artist_image_url
+    def to_dict(self, skip_none=False):
+        ret = self._fields_dict(skip_none)
         if self._info is not None:
-            ret['info'] = self._info.to_dict()
-        ret['sortName'] = self._sort_name
-        ret['roles'] = self._roles
-        if self._albums:
-            ret['album'] = [entry.to_dict() for entry in self._albums]
+            ret['info'] = self._info.to_dict(skip_none)
+        if self.albums:
+            ret['album'] = [entry.to_dict(skip_none) for entry in self._albums]
         return ret
 
-    album_count = property(lambda s: s._album_count)
-    artist_image_url = property(lambda s: s._artist_image_url)
-    name = property(lambda s: s._name)
-    sort_name = property(lambda s: s._sort_name)
-    albums = property(lambda s: s._albums)
+    album_count = property(attrgetter('_album_count'))
+    artist_image_url = property(attrgetter('_artist_image_url'))
+    name = property(attrgetter('_name'))
+    sort_name = property(attrgetter('_sort_name'))
+    albums = _lazy_children('_albums', Album)
     def set_info(self, info: ArtistInfo):
         self._info = info
-    info = property(lambda s: s._info, set_info)
-    sort_name = property(lambda s: s._sort_name)
-    roles = property(lambda s: s._roles)
-    mb_id = property(lambda s: s._info.mb_id if s._info is not None else '')
+        self._mb_id = info.mb_id if info is not None else ''
+    info = property(attrgetter('_info'), set_info)
+    sort_name = property(attrgetter('_sort_name'))
+    roles = property(attrgetter('_roles'))
+    mb_id = property(attrgetter('_mb_id'))
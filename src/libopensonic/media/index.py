@@ -15,6 +15,7 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
+from operator import attrgetter
 from .artist import Artist
 
 class Index:
@@ -29,9 +30,7 @@ class Index:
     """
     def __init__(self, info):
         self._name = info['name']
-        self._artists = []
-        for entry in info['artist']:
-            self._artists.append(Artist(entry))
+        self._artists = [Artist(entry) for entry in info.get('artist') or ()]
 
-    name = property(lambda s: s._name)
-    artists = property(lambda s: s._artists)
\ No newline at end of file
+    name = property(attrgetter('_name'))
+    artists = property(attrgetter('_artists'))
\ No newline at end of file
@@ -15,29 +15,160 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
+from operator import attrgetter
+from sys import intern
 from warnings import warn
 
 
+# Keys whose values repeat across most items in a listing (every song on an
+# album shares the artist, genre, suffix, ...).  Their strings are interned so
+# a large library holds one copy of each value rather than one per item.
+_INTERNED_KEYS = frozenset(('genre', 'artist', 'artistId', 'status', 'contentType',
+    'suffix', 'type', 'parent'))
+
+
 def get_key(store, key, default=None):
     """
     Quality of life helper function to give the keyed value if it exists,
     the default specified (None if not specified) otherwise.
+
+    The media classes use dict.get directly; this is kept for code that
+    imports it.
+    """
+    return store.get(key, default)
+
+
+def _interned(store, key, default=None):
+    """
+    Like get_key() but the value is interned if it is a string
+    """
+    value = store.get(key, default)
+    if type(value) is str:
+        return intern(value)
+    return value
+
+
+def _required(store, key, cls_name, default=None, stacklevel=3):
     """
-    return store[key] if key in store else default
+    Used when parsing server returns for keys that are marked required by the
+    specification.  Warns and returns default if the key is missing or null.
+
+    The warning points at the code that built the object, so with the default
+    warning filters a listing missing the same field on every item reports it
+    once rather than once per item.
+
+    cls_name:str    The media class name used in the warning
+    stacklevel:int  Passed to warn(), the default suits a direct call from a
+                    media class's __init__
+    """
+    value = store.get(key)
+    if value is not None:
+        return value
+    warn(f"{cls_name} object returned by server is missing required field '{key}'",
+        stacklevel=stacklevel)
+    return default
+
+
+def _lazy_children(attr, factory):
+    """
+    Returns a property for a list of child media objects that is only built,
+    by calling factory on each entry, the first time it is read.  Until then
+    the server's entries are held in the '<attr>_raw' slot.
+
+    attr:str            The slot holding the built list (None until read)
+    factory:callable    Builds one child from one entry of the server's list
+    """
+    raw_attr = attr + '_raw'
+
+    def get(self):
+        items = getattr(self, attr)
+        if items is None:
+            items = [factory(entry) for entry in getattr(self, raw_attr) or ()]
+            setattr(self, attr, items)
+            setattr(self, raw_attr, None)
+        return items
+    return property(get)
+
+
+def _drop_none(store):
+    """
+    Returns a copy of store without the keys whose value is None
+    """
+    return {key: value for key, value in store.items() if value is not None}
+
+
+def _compile_loader(fields):
+    """
+    Generates a _load_optional() method with one straight line assignment per
+    entry in fields, so building an object runs no loop and no setattr()
+
+    fields:tuple        A class's _OPTIONAL_FIELDS
+    """
+    ns = {'_interned': _interned}
+    lines = ['def _load_optional(self, info):', '    get = info.get']
+    for i, (attr, key, default) in enumerate(fields):
+        ns[f'_default{i}'] = default
+        if key in _INTERNED_KEYS:
+            lines.append(f'    self.{attr} = _interned(info, {key!r}, _default{i})')
+        else:
+            lines.append(f'    self.{attr} = get({key!r}, _default{i})')
+    exec('\n'.join(lines), ns)
+    return ns['_load_optional']
+
+
+def _compile_dumper(fields, extra):
+    """
+    Generates a _fields_dict() method returning the MediaBase fields, every
+    field in fields and every field in extra as one dict display, keyed the
+    way the server names them, so to_dict() is built from the same table the
+    object is loaded from
+
+    fields:tuple        A class's _OPTIONAL_FIELDS
+    extra:tuple         A class's _DICT_FIELDS
+    """
+    items = ['id', '_id'], ['coverId', '_cover_id'], ['starred', '_starred']
+    items += tuple([key, attr] for attr, key, _ in fields)
+    items += tuple([key, attr] for attr, key in extra)
+    src = ('def _fields_dict(self, skip_none=False):\n'
+        '    ret = {%s}\n'
+        '    return _drop_none(ret) if skip_none else ret') % ', '.join(
+        f'{key!r}: self.{attr}' for key, attr in items)
+    ns = {'_drop_none': _drop_none}
+    exec(src, ns)
+    return ns['_fields_dict']
 
 
 class Cover:
+    __slots__ = ('_type', '_bytes')
+
     def __init__(self, my_type, my_bytes):
         self._type = my_type
         self._bytes = my_bytes
-    type = property(lambda s: s._type)
-    bytes = property(lambda s: s._bytes)
+    type = property(attrgetter('_type'))
+    bytes = property(attrgetter('_bytes'))
 
 
 class MediaBase:
     """
     Base class for media items, this class should not be used directly
     """
+    __slots__ = ('_id', '_cover_id', '_starred')
+
+    # (attribute, key, default) for each optional field a subclass copies
+    # straight from the server's dict with _load_optional()
+    _OPTIONAL_FIELDS = ()
+    # (attribute, key) for the fields a subclass sets itself in __init__ that
+    # to_dict() also reports
+    _DICT_FIELDS = ()
+    _fields_dict = _compile_dumper(_OPTIONAL_FIELDS, _DICT_FIELDS)
+
+    def __init_subclass__(cls, **kwargs):
+        # Each subclass gets a _load_optional() and a _fields_dict() generated
+        # from its tables, see _compile_loader() and _compile_dumper()
+        super().__init_subclass__(**kwargs)
+        cls._load_optional = _compile_loader(cls._OPTIONAL_FIELDS)
+        cls._fields_dict = _compile_dumper(cls._OPTIONAL_FIELDS, cls._DICT_FIELDS)
+
     def __init__(self, info):
         """
         The Media class consolidates fields and methods common to all "Media" things
@@ -47,29 +178,31 @@ class MediaBase:
                                             Must contain id field
                                             May contain coverArt and starred field
         """
-        self._id = self.get_required_key(info, 'id')
-        self._cover_id = get_key(info, 'coverArt')
-        self._starred = get_key(info, 'starred')
+        self._id = _required(info, 'id', type(self).__name__, stacklevel=4)
+        self._cover_id = info.get('coverArt')
+        self._starred = info.get('starred')
 
-    def to_dict(self):
+    def to_dict(self, skip_none=False):
         """
         Return a dictonary representation of self.
+
+        skip_none:bool      Leave out the fields that are None (usually the
+                            ones the server did not send), here and in any
+                            nested media
         """
-        return {'id': self._id, 'coverId': self._cover_id, 'starred': self._starred}
+        return self._fields_dict(skip_none)
 
     @classmethod
     def get_class_name(cls):
         return cls.__name__
 
-    id = property(lambda s: s._id)
-    cover_id = property(lambda s: s._cover_id)
-    starred = property(lambda s: s._starred)
+    id = property(attrgetter('_id'))
+    cover_id = property(attrgetter('_cover_id'))
+    starred = property(attrgetter('_starred'))
 
     def get_required_key(self, store, key, default=None):
         """
         Used when parsing server returns for keys that are marked required by the specification.
         """
-        if key in store:
-            return store[key]
-        warn(f"{self.get_class_name()} object returned by server is missing required field '{key}'")
-        return default
+        return _required(store, key, self.get_class_name(), default, 4)
+
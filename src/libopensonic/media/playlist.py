@@ -15,48 +15,52 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase, _lazy_children, _required
 from .song import Song
 
 class Playlist(MediaBase):
+    __slots__ = ('_name', '_comment', '_owner', '_public', '_song_count', '_created',
+        '_changed', '_duration', '_songs', '_songs_raw', '_allowed_users')
+
+    _OPTIONAL_FIELDS = (
+        ('_comment', 'comment', None),
+        ('_owner', 'owner', None),
+        ('_public', 'public', False),
+        ('_allowed_users', 'allowedUser', None),
+    )
+    _DICT_FIELDS = (
+        ('_name', 'name'),
+        ('_song_count', 'soungCount'),
+        ('_created', 'created'),
+        ('_duration', 'duration'),
+        ('_cover_id', 'coverArt'),
+    )
+
     def __init__(self, info):
-        self._name = self.get_required_key(info, 'name')
-        self._comment = get_key(info, 'comment')
-        self._owner = get_key(info, 'owner')
-        self._public = get_key(info, 'public', False)
-        self._song_count = self.get_required_key(info, 'songCount', 0)
-        self._created = self.get_required_key(info,'created')
-        self._changed = self.get_required_key(info, 'changed')
-        self._duration = self.get_required_key(info, 'duration', 0)
-        self._cover_id = get_key(info, 'coverArt')
-        self._songs = []
-        if 'entry' in info and info['entry']:
-            for entry in info['entry']:
-                self._songs.append(Song(entry))
-        self._allowed_users = get_key(info, 'allowedUser')
+        self._load_optional(info)
+        self._name = _required(info, 'name', 'Playlist')
+        self._song_count = _required(info, 'songCount', 'Playlist', 0)
+        self._created = _required(info, 'created', 'Playlist')
+        self._changed = _required(info, 'changed', 'Playlist')
+        self._duration = _required(info, 'duration', 'Playlist', 0)
+        self._songs = None
+        self._songs_raw = info.get('entry')
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['name'] = self._name
-        ret['comment'] = self._comment
-        ret['owner'] = self._owner
-        ret['public'] = self._public
-        ret['soungCount'] = self._song_count
-        ret['created'] = self._created
-        ret['duration'] = self._duration
-        ret['coverArt'] = self._cover_id
-        if self._songs:
-            ret['entry'] = [entry.to_dict() for entry in self._songs]
+    def to_dict(self, skip_none=False):
+        ret = self._fields_dict(skip_none)
+        if self.songs:
+            ret['entry'] = [entry.to_dict(skip_none) for entry in self._songs]
         return ret
 
-    name = property(lambda s: s._name)
-    comment = property(lambda s: s._comment)
-    owner = property(lambda s: s._owner)
-    public = property(lambda s: s._public)
-    song_count = property(lambda s: s._song_count)
-    created = property(lambda s: s._created)
-    changed = property(lambda s: s._changed)
-    duration = property(lambda s: s._duration)
-    songs = property(lambda s: s._songs)
-    cover_id = property(lambda s: s._cover_id)
+    name = property(attrgetter('_name'))
+    comment = property(attrgetter('_comment'))
+    owner = property(attrgetter('_owner'))
+    public = property(attrgetter('_public'))
+    song_count = property(attrgetter('_song_count'))
+    created = property(attrgetter('_created'))
+    changed = property(attrgetter('_changed'))
+    duration = property(attrgetter('_duration'))
+    songs = _lazy_children('_songs', Song)
+    cover_id = property(attrgetter('_cover_id'))
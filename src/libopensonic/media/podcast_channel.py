@@ -15,36 +15,37 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase, _lazy_children
 from .podcast_episode import PodcastEpisode
 
 class PodcastChannel(MediaBase):
+    __slots__ = ('_url', '_title', '_description', '_status',
+        '_original_image_url', '_episodes', '_episodes_raw')
+
+    _OPTIONAL_FIELDS = (
+        ('_url', 'url', None),
+        ('_title', 'title', None),
+        ('_description', 'description', None),
+        ('_status', 'status', None),
+        ('_original_image_url', 'originalImageUrl', None),
+    )
+
     def __init__(self, info):
-        self._url = get_key(info, 'url')
-        self._title = get_key(info, 'title')
-        self._description = get_key(info, 'description')
-        self._status = get_key(info, 'status')
-        self._original_image_url = get_key(info, 'originalImageUrl')
-        self._episodes = []
-        if 'episode' in info and info['episode']:
-            for entry in info['episode']:
-                self._episodes.append(PodcastEpisode(entry))
+        self._load_optional(info)
+        self._episodes = None
+        self._episodes_raw = info.get('episode')
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['url'] = self._url
-        ret['title'] = self._title
-        ret['description'] = self._description
-        ret['status'] = self._status
-        ret['originalImageUrl'] = self._original_image_url
-        if self._episodes:
-            ret['episode'] = [entry.to_dict() for entry in self._episodes]
+    def to_dict(self, skip_none=False):
+        ret = self._fields_dict(skip_none)
+        if self.episodes:
+            ret['episode'] = [entry.to_dict(skip_none) for entry in self._episodes]
         return ret
 
-    url = property(lambda s: s._url)
-    title = property(lambda s: s._title)
-    description = property(lambda s: s._description)
-    status = property(lambda s: s._status)
-    original_image_url = property(lambda s: s._original_image_url)
-    episodes = property(lambda s: s._episodes)
+    url = property(attrgetter('_url'))
+    title = property(attrgetter('_title'))
+    description = property(attrgetter('_description'))
+    status = property(attrgetter('_status'))
+    original_image_url = property(attrgetter('_original_image_url'))
+    episodes = _lazy_children('_episodes', PodcastEpisode)
@@ -15,61 +15,50 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase
 
 class PodcastEpisode(MediaBase):
+    __slots__ = ('_stream_id', '_channel_id', '_title', '_description', '_publish_date',
+        '_status', '_parent', '_is_dir', '_year', '_genre', '_size', '_duration',
+        '_bitrate', '_path', '_suffix', '_content_type')
+
+    _OPTIONAL_FIELDS = (
+        ('_stream_id', 'streamId', None),
+        ('_channel_id', 'channelId', None),
+        ('_title', 'title', None),
+        ('_description', 'description', None),
+        ('_publish_date', 'publishDate', None),
+        ('_status', 'status', None),
+        ('_parent', 'parent', None),
+        ('_is_dir', 'isDir', None),
+        ('_year', 'year', None),
+        ('_genre', 'genre', None),
+        ('_size', 'size', None),
+        ('_duration', 'duration', None),
+        ('_bitrate', 'bitrate', None),
+        ('_path', 'path', None),
+        ('_suffix', 'suffix', None),
+        ('_content_type', 'contentType', None),
+    )
+
     def __init__(self, info):
-        self._stream_id = get_key(info, 'streamId')
-        self._channel_id = get_key(info, 'channelId')
-        self._title = get_key(info, 'title')
-        self._description = get_key(info, 'description')
-        self._publish_date = get_key(info, 'publishDate')
-        self._status = get_key(info, 'status')
-        self._parent = get_key(info, 'parent')
-        self._is_dir = get_key(info, 'isDir')
-        self._year = get_key(info, 'year')
-        self._genre = get_key(info, 'genre')
-        self._size = get_key(info, 'size')
-        self._duration = get_key(info, 'duration')
-        self._bitrate = get_key(info, 'bitrate')
-        self._path = get_key(info, 'path')
-        self._suffix = get_key(info, 'suffix')
-        self._content_type = get_key(info, 'contentType')
+        self._load_optional(info)
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['streamId'] = self._stream_id
-        ret['channelId'] = self._channel_id
-        ret['title'] = self._title
-        ret['description'] = self._description
-        ret['publishDate'] = self._publish_date
-        ret['status'] = self._status
-        ret['parent'] = self._parent
-        ret['isDir'] = self._is_dir
-        ret['year'] = self._year
-        ret['genre'] = self._genre
-        ret['size'] = self._size
-        ret['duration'] = self._duration
-        ret['bitrate'] = self._bitrate
-        ret['path'] = self._path
-        ret['suffix'] = self._suffix
-        ret['contentType'] = self._content_type
-        return ret
-
-    stream_id = property(lambda s: s._stream_id)
-    channel_id = property(lambda s: s._channel_id)
-    title = property(lambda s: s._title)
-    description = property(lambda s: s._description)
-    publish_date = property(lambda s: s._publish_date)
-    status = property(lambda s: s._status)
-    parent = property(lambda s: s._parent)
-    is_dir = property(lambda s: s._is_dir)
-    year = property(lambda s: s._year)
-    genre = property(lambda s: s._genre)
-    size = property(lambda s: s._size)
-    duration = property(lambda s: s._duration)
-    bitrate = property(lambda s: s._bitrate)
-    path = property(lambda s: s._path)
-    suffix = property(lambda s: s._suffix)
-    content_type = property(lambda s: s._content_type)
+    stream_id = property(attrgetter('_stream_id'))
+    channel_id = property(attrgetter('_channel_id'))
+    title = property(attrgetter('_title'))
+    description = property(attrgetter('_description'))
+    publish_date = property(attrgetter('_publish_date'))
+    status = property(attrgetter('_status'))
+    parent = property(attrgetter('_parent'))
+    is_dir = property(attrgetter('_is_dir'))
+    year = property(attrgetter('_year'))
+    genre = property(attrgetter('_genre'))
+    size = property(attrgetter('_size'))
+    duration = property(attrgetter('_duration'))
+    bitrate = property(attrgetter('_bitrate'))
+    path = property(attrgetter('_path'))
+    suffix = property(attrgetter('_suffix'))
+    content_type = property(attrgetter('_content_type'))
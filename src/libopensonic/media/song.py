@@ -15,97 +15,81 @@ You should have received a copy of the GNU General Public License
 along with py-opensonic.  If not, see <http://www.gnu.org/licenses/>
 """
 
-from .media_base import MediaBase, get_key
+from operator import attrgetter
+from .media_base import MediaBase, _lazy_children
 from . import artist
 
 class Song(MediaBase):
+    __slots__ = ('_parent', '_title', '_album', '_album_id', '_artist', '_display_artist',
+        '_display_album_artist', '_artist_id', '_artists', '_artists_raw', '_album_artists',
+        '_album_artists_raw', '_is_dir', '_created', '_duration', '_bit_rate', '_size',
+        '_suffix', '_content_type', '_is_video', '_path', '_track', '_disc_number', '_type',
+        '_year', '_transcoded_content_type', '_transcoded_suffix')
+
+    _OPTIONAL_FIELDS = (
+        ('_parent', 'parent', None),
+        ('_title', 'title', None),
+        ('_album', 'album', None),
+        ('_album_id', 'albumId', None),
+        ('_artist', 'artist', None),
+        ('_display_artist', 'displayArtist', None),
+        ('_display_album_artist', 'displayAlbumArtist', None),
+        ('_artist_id', 'artistId', None),
+        ('_is_dir', 'isDir', None),
+        ('_created', 'created', None),
+        ('_duration', 'duration', 0),
+        ('_bit_rate', 'bitRate', None),
+        ('_size', 'size', None),
+        ('_suffix', 'suffix', None),
+        ('_content_type', 'contentType', None),
+        ('_is_video', 'isVideo', None),
+        ('_path', 'path', None),
+        ('_disc_number', 'discNumber', 1),
+        ('_track', 'track', 1),
+        ('_type', 'type', None),
+        ('_year', 'year', None),
+        ('_transcoded_content_type', 'transcodedContentType', None),
+        ('_transcoded_suffix', 'transcodedSuffix', None),
+    )
+
     def __init__(self, info):
-        self._parent = get_key(info, 'parent')
-        self._title = get_key(info, 'title')
-        self._album = get_key(info, 'album')
-        self._album_id = get_key(info, 'albumId')
-        self._artist = get_key(info, 'artist')
-        self._display_artist = get_key(info, 'displayArtist')
-        self._display_album_artist = get_key(info, 'displayAlbumArtist')
-        self._artist_id = get_key(info, 'artistId')
-        self._artists = []
-        if 'artists' in info and info['artists']:
-            for entry in info['artists']:
-                self._artists.append(artist.Artist(entry))
-        self._album_artists = []
-        if 'albumArtists' in info and info['albumArtists']:
-            for entry in info['albumArtists']:
-                self._album_artists.append(artist.Artist(entry))
-        self._is_dir = get_key(info, 'isDir')
-        self._created = get_key(info, 'created')
-        self._duration = get_key(info, 'duration', 0)
-        self._bit_rate = get_key(info, 'bitRate')
-        self._size = get_key(info, 'size')
-        self._suffix = get_key(info, 'suffix')
-        self._content_type = get_key(info, 'contentType')
-        self._is_video = get_key(info, 'isVideo')
-        self._path = get_key(info, 'path')
-        self._track = get_key(info, 'track', 1)
-        self._disc_number = get_key(info, 'discNumber', 1)
-        self._type = get_key(info, 'type')
-        self._year = get_key(info, 'year')
-        self._transcoded_content_type = get_key(info, 'transcodedContentType')
-        self._transcoded_suffix = get_key(info, 'transcodedSuffix')
+        self._load_optional(info)
+        self._artists = None
+        self._artists_raw = info.get('artists')
+        self._album_artists = None
+        self._album_artists_raw = info.get('albumArtists')
         super().__init__(info)
 
-    def to_dict(self):
-        ret = super().to_dict()
-        ret['parent'] = self._parent
-        ret['title'] = self._title
-        ret['album'] = self._album
-        ret['albumId'] = self._album_id
-        ret['artist'] = self._artist
-        ret['displayArtist'] = self._display_artist
-        ret['displayAlbumArtist'] = self._display_album_artist
-        ret['artistId'] = self._artist_id
-        ret['isDir'] = self._is_dir
-        ret['created'] = self._created
-        ret['duration'] = self._duration
-        ret['bitRate'] = self._bit_rate
-        ret['size'] = self._size
-        ret['suffix'] = self._suffix
-        ret['contentType'] = self._content_type
-        ret['isVideo'] = self._is_video
-        ret['path'] = self._path
-        ret['discNumber'] = self._disc_number
-        ret['track'] = self._track
-        ret['type'] = self._type
-        ret['year'] = self._year
-        ret['transcodedContentType'] = self._transcoded_content_type
-        ret['transcodedSuffix'] = self._transcoded_suffix
-        if self._artists:
-            ret['artists'] = [entry.to_dict() for entry in self.artists]
-        if self._album_artists:
-            ret['albumArtists'] = [entry.to_dict() for entry in self._album_artists]
+    def to_dict(self, skip_none=False):
+        ret = self._fields_dict(skip_none)
+        if self.artists:
+            ret['artists'] = [entry.to_dict(skip_none) for entry in self._artists]
+        if self.album_artists:
+            ret['albumArtists'] = [entry.to_dict(skip_none) for entry in self._album_artists]
         return ret
 
-    parent = property(lambda s: s._parent)
-    title = property(lambda s: s._title)
-    album = property(lambda s: s._album)
-    album_id = property(lambda s: s._album_id)
-    artist = property(lambda s: s._artist)
-    display_artist = property(lambda s: s._display_artist)
-    display_album_artist = property(lambda s: s._display_album_artist)
-    artists = property(lambda s: s._artists)
-    album_artists = property(lambda s: s._album_artists)
-    artist_id = property(lambda s: s._artist_id)
-    is_dir = property(lambda s: s._is_dir)
-    created = property(lambda s: s._created)
-    duration = property(lambda s: s._duration)
-    bit_rate = property(lambda s: s._bit_rate)
-    size = property(lambda s: s._size)
-    suffix = property(lambda s: s._suffix)
-    content_type = property(lambda s: s._content_type)
-    is_video = property(lambda s: s._is_video)
-    path = property(lambda s: s._path)
-    track = property(lambda s: s._track)
-    type = property(lambda s: s._type)
-    year = property(lambda s: s._year)
-    disc_number = property(lambda s: s._disc_number)
-    transcoded_content_type = property(lambda s: s._transcoded_content_type)
-    transcoded_suffix = property(lambda s: s._transcoded_suffix)
+    parent = property(attrgetter('_parent'))
+    title = property(attrgetter('_title'))
+    album = property(attrgetter('_album'))
+    album_id = property(attrgetter('_album_id'))
+    artist = property(attrgetter('_artist'))
+    display_artist = property(attrgetter('_display_artist'))
+    display_album_artist = property(attrgetter('_display_album_artist'))
+    artists = _lazy_children('_artists', lambda entry: artist.Artist(entry))
+    album_artists = _lazy_children('_album_artists', lambda entry: artist.Artist(entry))
+    artist_id = property(attrgetter('_artist_id'))
+    is_dir = property(attrgetter('_is_dir'))
+    created = property(attrgetter('_created'))
+    duration = property(attrgetter('_duration'))
+    bit_rate = property(attrgetter('_bit_rate'))
+    size = property(attrgetter('_size'))
+    suffix = property(attrgetter('_suffix'))
+    content_type = property(attrgetter('_content_type'))
+    is_video = property(attrgetter('_is_video'))
+    path = property(attrgetter('_path'))
+    track = property(attrgetter('_track'))
+    type = property(attrgetter('_type'))
+    year = property(attrgetter('_year'))
+    disc_number = property(attrgetter('_disc_number'))
+    transcoded_content_type = property(attrgetter('_transcoded_content_type'))
+    transcoded_suffix = property(attrgetter('_transcoded_suffix'))